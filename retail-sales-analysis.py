@@ -1,9 +1,246 @@
-import pandas as pd
+import polars as pl
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to disk, so skip GUI backend setup
 import matplotlib.pyplot as plt
-import seaborn as sns
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from numba import get_num_threads, njit, prange
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
+import csv
 import os
+import sys
+import threading
+
+# Bump whenever the layout of the Parquet cache changes so caches written
+# by older versions are ignored
+CACHE_VERSION = 2
+
+SALES_COLUMNS = ('date', 'store_id', 'product_type', 'product_name', 'location', 'sales_amount')
+CATEGORICAL_COLUMNS = ('store_id', 'product_type', 'product_name', 'location')
+
+# Sales amounts are stored as float32 to halve the bytes every aggregation
+# streams. Each amount is rounded to float32 when parsed, which resolves
+# individual cents only below about $131k; sums and means upcast to float64
+# so accumulation adds no further error, and the report rounds to cents
+SALES_AMOUNT = pl.col('sales_amount').cast(pl.Float64)
+
+# Months are binned on a single int32 key (year * 12 + month - 1) rather
+# than on truncated dates; _month_start maps a key back to its first day
+MONTH_KEY = (
+    pl.col('date').dt.year().cast(pl.Int32) * 12 + pl.col('date').dt.month().cast(pl.Int32) - 1
+).alias('month_key')
+
+def _month_start(month_key: pl.Expr) -> pl.Expr:
+    """
+    Map a month key back to the first day of its month.
+    
+    Args:
+        month_key (pl.Expr): Expression producing MONTH_KEY values
+    
+    Returns:
+        Date expression aliased to 'date'
+    """
+    return pl.date(month_key // 12, month_key % 12 + 1, 1).alias('date')
+
+def _normalize_column_names(columns: List[str]) -> List[str]:
+    """
+    Ensure consistent column names.
+    
+    Args:
+        columns (List[str]): Column names as found in the CSV header
+    
+    Returns:
+        Lower-case column names with spaces replaced by underscores
+    """
+    return [col.lower().replace(' ', '_') for col in columns]
+
+def _scan_csv(sales_file: str) -> pl.LazyFrame:
+    """
+    Lazily scan the sales CSV with Polars.
+    
+    Nothing is read until a query plan is collected, so every analysis
+    runs on Polars' multi-threaded engine.
+    
+    Args:
+        sales_file (str): Path to the sales CSV file
+    
+    Returns:
+        LazyFrame over the analysed columns
+    """
+    return pl.scan_csv(
+        sales_file,
+        try_parse_dates=True,
+        with_column_names=_normalize_column_names,
+        schema_overrides={
+            **{col: pl.Categorical for col in CATEGORICAL_COLUMNS},
+            'sales_amount': pl.Float32
+        }
+    ).select(SALES_COLUMNS)
+
+def _cache_is_valid(cache_file: str, sales_file: str) -> bool:
+    """
+    Check whether a Parquet cache can stand in for the sales CSV.
+    
+    Args:
+        cache_file (str): Path to the Parquet cache
+        sales_file (str): Path to the sales CSV file it was written from
+    
+    Returns:
+        True if the cache is at least as new as the CSV and has the schema
+        the CSV parses to
+    """
+    if not os.path.exists(cache_file) or \
+            os.path.getmtime(cache_file) < os.path.getmtime(sales_file):
+        return False
+    try:
+        return pl.scan_parquet(cache_file).collect_schema() == _scan_csv(sales_file).collect_schema()
+    except (OSError, pl.exceptions.PolarsError):
+        return False
+
+def _read_csv_pyarrow(sales_file: str) -> pl.LazyFrame:
+    """
+    Read the sales CSV with PyArrow's multi-threaded reader.
+    
+    Only the analysed columns are converted, and the categorical columns
+    are decoded straight into Arrow dictionary arrays, which Polars adopts
+    as Categorical without re-encoding. PyArrow only recognises ISO dates,
+    so dates are read as text and parsed by Polars into the same type the
+    Polars reader infers, keeping both readers on one schema.
+    
+    Args:
+        sales_file (str): Path to the sales CSV file
+    
+    Returns:
+        LazyFrame over the in-memory Arrow table
+    """
+    with open(sales_file, newline='') as f:
+        header = next(csv.reader(f))
+    date_dtype = _scan_csv(sales_file).collect_schema()['date']
+    
+    table = pa_csv.read_csv(
+        sales_file,
+        read_options=pa_csv.ReadOptions(
+            column_names=_normalize_column_names(header),
+            skip_rows=1
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=list(SALES_COLUMNS),
+            column_types={
+                **{col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORICAL_COLUMNS},
+                'date': pa.string(),
+                'sales_amount': pa.float32()
+            }
+        )
+    )
+    sales = pl.from_arrow(table).lazy()
+    if date_dtype.is_temporal():
+        sales = sales.with_columns(pl.col('date').str.strptime(date_dtype))
+    return sales
+
+def _to_markdown(df: pl.DataFrame) -> str:
+    """
+    Render a Polars DataFrame as a markdown table.
+    
+    Every float column in the report is a monetary amount, so floats are
+    shown to the cent, which also hides float32 parsing noise.
+    
+    Args:
+        df (pl.DataFrame): Frame to render
+    
+    Returns:
+        Markdown table without dtype or shape annotations
+    """
+    with pl.Config(tbl_formatting='MARKDOWN',
+                   tbl_hide_column_data_types=True,
+                   tbl_hide_dataframe_shape=True,
+                   tbl_rows=-1,
+                   tbl_cols=-1,
+                   fmt_str_lengths=1000,
+                   fmt_float='full',
+                   float_precision=2):
+        return str(df)
+
+# Compiled kernels are cached on disk so only the first run pays the JIT
+# cost. Numba can only reload a cache for a module it can re-import, so
+# caching is skipped when this file is executed without being registered
+# in sys.modules (e.g. loaded via importlib without an import name)
+_CACHE_KERNELS = __name__ in sys.modules
+
+@njit(parallel=True, cache=_CACHE_KERNELS, error_model='numpy')
+def _gb_mean_std(values: np.ndarray, codes: np.ndarray, n_groups: int,
+                 n_chunks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Grouped mean and sample standard deviation in a single sweep.
+    
+    Each thread runs Welford's update over its own slice of the rows;
+    the per-thread partials are then merged with Chan's formula.
+    
+    Args:
+        values (np.ndarray): Values to aggregate
+        codes (np.ndarray): Dense group code of each value
+        n_groups (int): Number of distinct group codes
+        n_chunks (int): Number of row slices, normally the thread count
+    
+    Returns:
+        Tuple of per-group means and standard deviations
+    """
+    chunk_size = (len(values) + n_chunks - 1) // n_chunks
+    counts = np.zeros((n_chunks, n_groups))
+    means = np.zeros((n_chunks, n_groups))
+    m2 = np.zeros((n_chunks, n_groups))
+    for t in prange(n_chunks):
+        for i in range(t * chunk_size, min((t + 1) * chunk_size, len(values))):
+            c = codes[i]
+            x = np.float64(values[i])
+            counts[t, c] += 1
+            delta = x - means[t, c]
+            means[t, c] += delta / counts[t, c]
+            m2[t, c] += delta * (x - means[t, c])
+    
+    group_means = np.empty(n_groups)
+    group_stds = np.empty(n_groups)
+    for c in prange(n_groups):
+        count = 0.0
+        mean = 0.0
+        total_m2 = 0.0
+        for t in range(n_chunks):
+            if counts[t, c] == 0:
+                continue
+            merged = count + counts[t, c]
+            delta = means[t, c] - mean
+            mean += delta * counts[t, c] / merged
+            total_m2 += m2[t, c] + delta * delta * count * counts[t, c] / merged
+            count = merged
+        group_means[c] = mean
+        group_stds[c] = np.sqrt(total_m2 / (count - 1)) if count > 1 else np.nan
+    return group_means, group_stds
+
+@njit(parallel=True, cache=_CACHE_KERNELS, error_model='numpy')
+def _zscore_mask(values: np.ndarray, codes: np.ndarray, means: np.ndarray,
+                 stds: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Absolute z-score of every value against its group, plus the anomaly mask.
+    
+    Args:
+        values (np.ndarray): Values to score
+        codes (np.ndarray): Dense group code of each value
+        means (np.ndarray): Per-group means
+        stds (np.ndarray): Per-group standard deviations
+        threshold (float): Z-score above which a value is anomalous
+    
+    Returns:
+        Tuple of z-scores and boolean anomaly mask
+    """
+    zscores = np.empty(len(values))
+    mask = np.empty(len(values), dtype=np.bool_)
+    for i in prange(len(values)):
+        c = codes[i]
+        z = abs((np.float64(values[i]) - means[c]) / stds[c])
+        zscores[i] = z
+        mask[i] = z > threshold
+    return zscores, mask
 
 class RetailSalesAnalyzer:
     """
@@ -11,25 +248,286 @@ class RetailSalesAnalyzer:
     with advanced insights and visualizations.
     """
     
-    def __init__(self, sales_file: str):
+    def __init__(self, sales_file: str, use_pyarrow: bool = False, use_cache: bool = True):
         """
         Initialize the analyzer with sales data.
         
         Args:
             sales_file (str): Path to the sales CSV file
+            use_pyarrow (bool): Parse the CSV eagerly with PyArrow instead
+                of scanning it lazily with Polars
+            use_cache (bool): Keep a Parquet copy of the parsed data next to
+                the CSV and read it instead while it is newer than the CSV
+                and matches its schema
+        """
+        cache_file = f'{sales_file}.v{CACHE_VERSION}.parquet'
+        if use_cache and _cache_is_valid(cache_file, sales_file):
+            self.sales_df = pl.scan_parquet(cache_file)
+        else:
+            if use_pyarrow:
+                self.sales_df = _read_csv_pyarrow(sales_file)
+            else:
+                self.sales_df = _scan_csv(sales_file)
+            
+            # Parse once and serve re-runs from the typed, columnar copy;
+            # an unwritable directory just means reading the CSV every time
+            if use_cache:
+                try:
+                    self.sales_df.sink_parquet(cache_file, compression='zstd')
+                    self.sales_df = pl.scan_parquet(cache_file)
+                except OSError:
+                    pass
+        
+        # Report query plans are assembled once here; collecting them is
+        # then a single call into the Polars engine
+        self._plans = self._build_plans(self.sales_df)
+        
+        # Aggregated tables from _compute_all, filled on first use
+        self._cached = None
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_csv_streaming(cls, sales_file: str, chunksize: int = 2_000_000) -> 'RetailSalesAnalyzer':
+        """
+        Initialize the analyzer by aggregating the sales CSV chunk by chunk.
+        
+        Only one chunk of rows is held in memory at a time. Each chunk is
+        reduced to associative partials (sums and counts) that are merged
+        once the whole file has been read, so files larger than memory can
+        still be reported on. Row-level queries such as detect_anomalies
+        read the CSV lazily as usual.
+        
+        Args:
+            sales_file (str): Path to the sales CSV file
+            chunksize (int): Number of rows aggregated per chunk
+        
+        Returns:
+            RetailSalesAnalyzer with its report tables precomputed
+        """
+        analyzer = cls(sales_file, use_cache=False)
+        
+        # Each chunk runs the same plans as a full scan; only the sums,
+        # counts and distinct pairs of the partials are merged below
+        partials = {}
+        for chunk in _scan_csv(sales_file).collect_batches(chunk_size=chunksize, maintain_order=False):
+            plans = cls._build_plans(chunk.lazy())
+            for name, result in zip(plans.keys(), pl.collect_all(plans.values())):
+                partials.setdefault(name, []).append(result)
+        if not partials:
+            # A header-only file yields no chunks; leave the tables to the
+            # regular plans, which report empty data like the constructor
+            return analyzer
+        partials = {name: pl.concat(frames) for name, frames in partials.items()}
+        
+        # Merge the partials; means are derived from the merged sums and counts
+        def merge(name: str, key: str, mean_name: str) -> pl.DataFrame:
+            return partials[name].group_by(key).agg([
+                pl.col('total_sales').sum(),
+                pl.col('total_transactions').sum()
+            ]).select([
+                key,
+                'total_sales',
+                (pl.col('total_sales') / pl.col('total_transactions')).alias(mean_name),
+                'total_transactions'
+            ])
+        
+        analyzer._cached = cls._derive_tables({
+            'overview': partials['overview'].select([
+                pl.col('total_sales').sum(),
+                (pl.col('total_sales').sum() / pl.col('total_transactions').sum()).alias('average_transaction'),
+                pl.col('total_transactions').sum(),
+                pl.col('start_date').min(),
+                pl.col('end_date').max()
+            ]),
+            'stores': merge('stores', 'store_id', 'avg_sale'),
+            'monthly_store': partials['monthly_store'].group_by(['store_id', 'month_key']).agg(
+                pl.col('sales_amount').sum()
+            ),
+            'products': merge('products', 'product_type', 'avg_sale_per_product'),
+            'locations': merge('locations', 'location', 'avg_sale'),
+            'location_stores': partials['location_stores'].unique()
+        })
+        return analyzer
+    
+    @classmethod
+    def _build_plans(cls, sales: pl.LazyFrame) -> Dict[str, pl.LazyFrame]:
+        """
+        Assemble every report aggregation plan over a sales frame.
+        
+        Args:
+            sales (pl.LazyFrame): Full sales data or a single chunk of it
+        
+        Returns:
+            Dict of aggregation plans keyed by cached table name
         """
-        # Read large CSV file with optimized parsing
-        self.sales_df = pd.read_csv(sales_file, 
-                                    parse_dates=['date'],
-                                    dtype={
-                                        'store_id': 'category',
-                                        'product_type': 'category',
-                                        'product_name': 'category',
-                                        'location': 'category'
-                                    })
+        return {
+            'overview': cls._overview_plan(sales),
+            'stores': cls._store_plan(sales),
+            'monthly_store': cls._monthly_store_plan(sales),
+            'products': cls._product_plan(sales),
+            'locations': cls._location_plan(sales),
+            'location_stores': cls._location_stores_plan(sales)
+        }
+    
+    @staticmethod
+    def _overview_plan(sales: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Plan the overall sales totals.
+        
+        Args:
+            sales (pl.LazyFrame): Sales data to aggregate
+        
+        Returns:
+            Single-row plan with totals, mean and date bounds
+        """
+        return sales.select([
+            SALES_AMOUNT.sum().alias('total_sales'),
+            SALES_AMOUNT.mean().alias('average_transaction'),
+            pl.len().alias('total_transactions'),
+            pl.col('date').min().alias('start_date'),
+            pl.col('date').max().alias('end_date')
+        ])
+    
+    @staticmethod
+    def _store_plan(sales: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Plan the per-store sales aggregation.
+        
+        Args:
+            sales (pl.LazyFrame): Sales data to aggregate
+        
+        Returns:
+            Plan with total, average and transaction count per store
+        """
+        return sales.group_by('store_id').agg([
+            SALES_AMOUNT.sum().alias('total_sales'),
+            SALES_AMOUNT.mean().alias('avg_sale'),
+            pl.len().alias('total_transactions')
+        ])
+    
+    @staticmethod
+    def _monthly_store_plan(sales: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Plan monthly sales totals for each store.
+        
+        Args:
+            sales (pl.LazyFrame): Sales data to aggregate
+        
+        Returns:
+            Plan with summed sales per store and month key
+        """
+        return sales.group_by(['store_id', MONTH_KEY]).agg(SALES_AMOUNT.sum())
+    
+    @staticmethod
+    def _product_plan(sales: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Plan the per-product-category sales aggregation.
+        
+        Args:
+            sales (pl.LazyFrame): Sales data to aggregate
         
-        # Ensure consistent column names
-        self.sales_df.columns = [col.lower().replace(' ', '_') for col in self.sales_df.columns]
+        Returns:
+            Plan with total, average and transaction count per product type
+        """
+        return sales.group_by('product_type').agg([
+            SALES_AMOUNT.sum().alias('total_sales'),
+            SALES_AMOUNT.mean().alias('avg_sale_per_product'),
+            pl.len().alias('total_transactions')
+        ])
+    
+    @staticmethod
+    def _location_plan(sales: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Plan the per-location sales aggregation.
+        
+        Args:
+            sales (pl.LazyFrame): Sales data to aggregate
+        
+        Returns:
+            Plan with total, average and transaction count per location
+        """
+        return sales.group_by('location').agg([
+            SALES_AMOUNT.sum().alias('total_sales'),
+            SALES_AMOUNT.mean().alias('avg_sale'),
+            pl.len().alias('total_transactions')
+        ])
+    
+    @staticmethod
+    def _location_stores_plan(sales: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Plan the distinct (location, store) pairs.
+        
+        Stores per location are counted from these code pairs instead of
+        building a set of stores inside every location group.
+        
+        Args:
+            sales (pl.LazyFrame): Sales data to aggregate
+        
+        Returns:
+            Plan with one row per distinct location and store
+        """
+        return sales.select(['location', 'store_id']).unique()
+    
+    @staticmethod
+    def _derive_tables(cached: Dict[str, pl.DataFrame]) -> Dict[str, pl.DataFrame]:
+        """
+        Finish the report tables from the collected aggregations.
+        
+        Joins unique store counts into the location table and reduces the
+        small per-store monthly table to company-wide monthly and
+        quarterly trends, so neither step rescans the sales data.
+        
+        Args:
+            cached (Dict[str, pl.DataFrame]): Collected aggregation tables
+        
+        Returns:
+            The same dict with 'locations' completed and trend tables added
+        """
+        # Unique stores per location come from the distinct pairs
+        unique_stores = cached.pop('location_stores').group_by('location').agg(
+            pl.len().alias('unique_stores')
+        )
+        cached['locations'] = cached['locations'].join(unique_stores, on='location').select([
+            'location', 'total_sales', 'avg_sale', 'unique_stores', 'total_transactions'
+        ])
+        
+        # Company-wide trends
+        monthly_sales = cached['monthly_store'].group_by('month_key').agg(
+            pl.col('sales_amount').sum()
+        ).sort('month_key')
+        quarterly_sales = monthly_sales.group_by(
+            pl.col('month_key') // 3 * 3
+        ).agg(pl.col('sales_amount').sum()).sort('month_key')
+        
+        cached['monthly'] = monthly_sales.select([
+            _month_start(pl.col('month_key')),
+            'sales_amount',
+            (pl.col('month_key') % 12 + 1).cast(pl.Int8).alias('month')
+        ])
+        cached['quarterly'] = quarterly_sales.select([
+            _month_start(pl.col('month_key')),
+            'sales_amount',
+            (pl.col('month_key') % 12 // 3 + 1).cast(pl.Int8).alias('quarter')
+        ])
+        return cached
+    
+    def _compute_all(self) -> Dict[str, pl.DataFrame]:
+        """
+        Run every report aggregation in a single pass over the sales data.
+        
+        The plans built in __init__ are collected together so the optimizer
+        shares one scan of the data; the small aggregated tables are cached
+        and every public method slices its answer from them.
+        
+        Returns:
+            Dict of aggregated tables keyed by name
+        """
+        # Serialize the first computation so concurrent callers share it
+        with self._lock:
+            if self._cached is None:
+                results = pl.collect_all(self._plans.values(), engine='streaming')
+                self._cached = self._derive_tables(dict(zip(self._plans.keys(), results)))
+        return self._cached
     
     def basic_sales_overview(self) -> Dict[str, float]:
         """
@@ -38,17 +536,24 @@ class RetailSalesAnalyzer:
         Returns:
             Dict with key sales metrics
         """
+        overview = self._compute_all()['overview'].row(0, named=True)
+        
+        # Polars yields a null mean for an empty file; report it as NaN
+        average_transaction = overview['average_transaction']
+        if average_transaction is None:
+            average_transaction = float('nan')
+        
         return {
-            'total_sales': self.sales_df['sales_amount'].sum(),
-            'average_transaction': self.sales_df['sales_amount'].mean(),
-            'total_transactions': len(self.sales_df),
+            'total_sales': overview['total_sales'],
+            'average_transaction': average_transaction,
+            'total_transactions': overview['total_transactions'],
             'date_range': (
-                self.sales_df['date'].min(), 
-                self.sales_df['date'].max()
+                overview['start_date'],
+                overview['end_date']
             )
         }
     
-    def top_performing_stores(self, n: int = 10) -> pd.DataFrame:
+    def top_performing_stores(self, n: int = 10) -> pl.DataFrame:
         """
         Identify top performing stores.
         
@@ -58,15 +563,10 @@ class RetailSalesAnalyzer:
         Returns:
             DataFrame of top stores by total sales
         """
-        store_performance = self.sales_df.groupby('store_id').agg({
-            'sales_amount': ['sum', 'mean'],
-            'product_name': 'count'
-        }).reset_index()
-        
-        store_performance.columns = ['store_id', 'total_sales', 'avg_sale', 'total_transactions']
-        return store_performance.nlargest(n, 'total_sales')
+        store_performance = self._compute_all()['stores']
+        return store_performance.top_k(n, by='total_sales').sort('total_sales', descending=True)
     
-    def struggling_stores(self, threshold_percentile: float = 25) -> pd.DataFrame:
+    def struggling_stores(self, threshold_percentile: float = 25) -> pl.DataFrame:
         """
         Identify stores with declining or low performance.
         
@@ -77,26 +577,23 @@ class RetailSalesAnalyzer:
             DataFrame of struggling stores
         """
         # Monthly sales trend for each store
-        monthly_store_sales = self.sales_df.groupby([
-            pd.Grouper(key='date', freq='M'), 
-            'store_id'
-        ])['sales_amount'].sum().reset_index()
+        monthly_store_sales = self._compute_all()['monthly_store']
         
         # Calculate sales variability and trend
-        store_volatility = monthly_store_sales.groupby('store_id').agg({
-            'sales_amount': ['mean', 'std']
-        }).reset_index()
-        store_volatility.columns = ['store_id', 'avg_monthly_sales', 'sales_volatility']
+        store_volatility = monthly_store_sales.group_by('store_id').agg([
+            pl.col('sales_amount').mean().alias('avg_monthly_sales'),
+            pl.col('sales_amount').std().alias('sales_volatility')
+        ])
         
         # Identify stores below threshold
-        struggling = store_volatility[
-            store_volatility['avg_monthly_sales'] <= 
-            store_volatility['avg_monthly_sales'].quantile(threshold_percentile/100)
-        ]
+        struggling = store_volatility.filter(
+            pl.col('avg_monthly_sales') <=
+            pl.col('avg_monthly_sales').quantile(threshold_percentile/100, interpolation='linear')
+        ).sort('store_id')
         
         return struggling
     
-    def product_performance_analysis(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def product_performance_analysis(self) -> Tuple[pl.DataFrame, pl.DataFrame]:
         """
         Comprehensive product performance analysis.
         
@@ -104,64 +601,37 @@ class RetailSalesAnalyzer:
             Tuple of top and bottom performing product categories
         """
         # Product category performance
-        product_performance = self.sales_df.groupby('product_type').agg({
-            'sales_amount': ['sum', 'mean'],
-            'product_name': 'count'
-        }).reset_index()
-        
-        product_performance.columns = [
-            'product_type', 'total_sales', 'avg_sale_per_product', 'total_transactions'
-        ]
+        product_performance = self._compute_all()['products']
         
         # Top and bottom performing categories
-        top_products = product_performance.nlargest(5, 'total_sales')
-        bottom_products = product_performance.nsmallest(5, 'total_sales')
+        top_products = product_performance.top_k(5, by='total_sales').sort('total_sales', descending=True)
+        bottom_products = product_performance.bottom_k(5, by='total_sales').sort('total_sales')
         
         return top_products, bottom_products
     
-    def seasonal_trend_analysis(self) -> pd.DataFrame:
+    def seasonal_trend_analysis(self) -> Dict[str, pl.DataFrame]:
         """
         Analyze seasonal sales trends.
         
         Returns:
-            DataFrame with monthly and quarterly sales trends
+            Dict with monthly and quarterly sales trends
         """
-        # Monthly sales trend
-        monthly_sales = self.sales_df.groupby(
-            pd.Grouper(key='date', freq='M')
-        )['sales_amount'].sum().reset_index()
-        
-        # Quarterly sales trend
-        quarterly_sales = self.sales_df.groupby(
-            pd.Grouper(key='date', freq='Q')
-        )['sales_amount'].sum().reset_index()
-        
-        monthly_sales['month'] = monthly_sales['date'].dt.month
-        quarterly_sales['quarter'] = quarterly_sales['date'].dt.quarter
+        cached = self._compute_all()
         
         return {
-            'monthly_trend': monthly_sales,
-            'quarterly_trend': quarterly_sales
+            'monthly_trend': cached['monthly'],
+            'quarterly_trend': cached['quarterly']
         }
     
-    def location_based_insights(self) -> pd.DataFrame:
+    def location_based_insights(self) -> pl.DataFrame:
         """
         Analyze sales performance by location.
         
         Returns:
             DataFrame of location performance
         """
-        location_performance = self.sales_df.groupby('location').agg({
-            'sales_amount': ['sum', 'mean'],
-            'store_id': 'nunique',
-            'product_name': 'count'
-        }).reset_index()
-        
-        location_performance.columns = [
-            'location', 'total_sales', 'avg_sale', 'unique_stores', 'total_transactions'
-        ]
-        
-        return location_performance
+        # Group-by output order is not deterministic, so order by key
+        return self._compute_all()['locations'].sort('location')
     
     def visualize_sales_trends(self, output_dir: str = 'sales_visualizations'):
         """
@@ -173,29 +643,31 @@ class RetailSalesAnalyzer:
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
+        # A single figure is reused for every plot
+        fig, ax = plt.subplots(figsize=(12, 6))
+        
         # Monthly Sales Trend
-        plt.figure(figsize=(12, 6))
         monthly_sales = self.seasonal_trend_analysis()['monthly_trend']
-        plt.plot(monthly_sales['date'], monthly_sales['sales_amount'])
-        plt.title('Monthly Sales Trend')
-        plt.xlabel('Date')
-        plt.ylabel('Total Sales')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'monthly_sales_trend.png'))
-        plt.close()
+        ax.plot(monthly_sales['date'].to_numpy(), monthly_sales['sales_amount'].to_numpy())
+        ax.set_title('Monthly Sales Trend')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Total Sales')
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, 'monthly_sales_trend.png'))
         
         # Top Product Categories
         top_products, _ = self.product_performance_analysis()
-        plt.figure(figsize=(10, 6))
-        plt.bar(top_products['product_type'], top_products['total_sales'])
-        plt.title('Top 5 Product Categories by Sales')
-        plt.xlabel('Product Type')
-        plt.ylabel('Total Sales')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'top_product_categories.png'))
-        plt.close()
+        ax.clear()
+        fig.set_size_inches(10, 6)
+        ax.bar(top_products['product_type'].cast(pl.String).to_numpy(), top_products['total_sales'].to_numpy())
+        ax.set_title('Top 5 Product Categories by Sales')
+        ax.set_xlabel('Product Type')
+        ax.set_ylabel('Total Sales')
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, 'top_product_categories.png'))
+        plt.close(fig)
     
     def generate_comprehensive_report(self, output_file: str = 'sales_analysis_report.md'):
         """
@@ -204,12 +676,24 @@ class RetailSalesAnalyzer:
         Args:
             output_file (str): Path to save the markdown report
         """
-        # Collect insights
-        overview = self.basic_sales_overview()
-        top_stores = self.top_performing_stores()
-        struggling_stores = self.struggling_stores()
-        top_products, bottom_products = self.product_performance_analysis()
-        location_insights = self.location_based_insights()
+        # Collect insights concurrently; all sections are sliced from a
+        # single cached pass and Polars releases the GIL while computing
+        sections = {
+            'overview': self.basic_sales_overview,
+            'top_stores': self.top_performing_stores,
+            'struggling_stores': self.struggling_stores,
+            'product_performance': self.product_performance_analysis,
+            'location_insights': self.location_based_insights
+        }
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {name: executor.submit(fn) for name, fn in sections.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        
+        overview = results['overview']
+        top_stores = results['top_stores']
+        struggling_stores = results['struggling_stores']
+        top_products, bottom_products = results['product_performance']
+        location_insights = results['location_insights']
         
         # Create markdown report
         with open(output_file, 'w') as f:
@@ -224,24 +708,24 @@ class RetailSalesAnalyzer:
             
             # Top Performing Stores
             f.write("## Top Performing Stores\n")
-            f.write(top_stores.to_markdown(index=False))
+            f.write(_to_markdown(top_stores))
             f.write("\n\n")
             
             # Struggling Stores
             f.write("## Stores of Concern\n")
-            f.write(struggling_stores.to_markdown(index=False))
+            f.write(_to_markdown(struggling_stores))
             f.write("\n\n")
             
             # Product Performance
             f.write("## Top Product Categories\n")
-            f.write(top_products.to_markdown(index=False))
+            f.write(_to_markdown(top_products))
             f.write("\n\n")
             
             # Location Insights
             f.write("## Location Performance\n")
-            f.write(location_insights.to_markdown(index=False))
+            f.write(_to_markdown(location_insights))
     
-    def detect_anomalies(self, z_threshold: float = 3) -> pd.DataFrame:
+    def detect_anomalies(self, z_threshold: float = 3) -> pl.DataFrame:
         """
         Detect sales anomalies using statistical methods.
         
@@ -251,16 +735,22 @@ class RetailSalesAnalyzer:
         Returns:
             DataFrame of anomalous sales records
         """
-        # Group by store and product type
-        grouped = self.sales_df.groupby(['store_id', 'product_type'])
+        # Dense group code for every store and product type combination
+        sales = self.sales_df.with_columns(
+            (pl.struct(['store_id', 'product_type']).rank('dense') - 1).alias('group_code')
+        ).collect(engine='streaming')
+        values = sales['sales_amount'].to_numpy()
+        codes = sales['group_code'].to_numpy()
+        n_groups = int(codes.max()) + 1 if len(codes) else 0
         
-        # Calculate z-scores for sales amounts
-        self.sales_df['sales_zscore'] = grouped['sales_amount'].transform(
-            lambda x: np.abs((x - x.mean()) / x.std())
-        )
+        # Calculate z-scores for sales amounts in compiled kernels
+        means, stds = _gb_mean_std(values, codes, n_groups, get_num_threads())
+        zscores, mask = _zscore_mask(values, codes, means, stds, z_threshold)
         
         # Return anomalies beyond z-score threshold
-        return self.sales_df[self.sales_df['sales_zscore'] > z_threshold]
+        return sales.drop('group_code').with_columns(
+            pl.Series('sales_zscore', zscores)
+        ).filter(mask)
 
 # Example usage
 def main():
@@ -300,10 +790,11 @@ This Python script provides a comprehensive analysis of retail sales data, offer
 - Markdown report generation
 
 ## Requirements
-- pandas
+- polars (>=2.0, <3)
+- pyarrow
 - numpy
+- numba
 - matplotlib
-- seaborn
 
 ## Usage
 1. Install required libraries